@@ -222,63 +222,59 @@ for t in 30 60 120 180 300; do
         sleep $WAIT_TIME
     fi
 
-    echo "========================================" | tee -a "$REPORT_FILE"
-    echo "Time: ${t} seconds" | tee -a "$REPORT_FILE"
-    echo "========================================" | tee -a "$REPORT_FILE"
-
-    # Statistics for selected nodes
-    for i in 0 $(((NODE_COUNT-1)/2)) $((NODE_COUNT-1)); do
-        if [ $i -ge $NODE_COUNT ]; then
-            continue
-        fi
-
-        LOG="logs/${PREFIX}-$i.log"
-
-        if [ ! -f "$LOG" ]; then
-            continue
-        fi
-
-        if [ "$MODE" == "dns" ]; then
-            # DNS-specific metrics
-            MOCK_DNS=$(grep -c "Mock DNS" "$LOG" 2>/dev/null || echo "0")
-            DNS_SYNC=$(grep -c "DNS Discovery Status" "$LOG" 2>/dev/null || echo "0")
-            DISCOVERED=$(grep "Discovered Nodes:" "$LOG" 2>/dev/null | tail -1 | sed 's/.*Discovered Nodes: \([0-9]*\).*/\1/' || echo "0")
-            PING_SENT=$(grep -c "Sending PING to node:" "$LOG" 2>/dev/null || echo "0")
-            PONG_RECV=$(grep -c "Received PONG from node:" "$LOG" 2>/dev/null || echo "0")
-
-            echo "" | tee -a "$REPORT_FILE"
-            echo "Node $i:" | tee -a "$REPORT_FILE"
-            echo "  - Mock DNS enabled: $([ $MOCK_DNS -gt 0 ] && echo 'YES' || echo 'NO')" | tee -a "$REPORT_FILE"
-            echo "  - DNS sync checks: $DNS_SYNC" | tee -a "$REPORT_FILE"
-            echo "  - Discovered nodes: $DISCOVERED" | tee -a "$REPORT_FILE"
-            echo "  - PING sent: $PING_SENT" | tee -a "$REPORT_FILE"
-            echo "  - PONG received: $PONG_RECV" | tee -a "$REPORT_FILE"
-        else
-            # DHT-specific metrics
-            PING_SENT=$(grep -c "Sending PING to node:" "$LOG" 2>/dev/null || echo "0")
-            PONG_RECV=$(grep -c "Received PONG from node:" "$LOG" 2>/dev/null || echo "0")
-            FIND_NODE=$(grep -c "Sending FIND_NODE to node:" "$LOG" 2>/dev/null || echo "0")
-            NEIGHBORS=$(grep -c "Received NEIGHBORS from node:" "$LOG" 2>/dev/null || echo "0")
-            DISCOVERED=$(grep "Discovered Nodes:" "$LOG" 2>/dev/null | tail -1 | sed 's/.*Discovered Nodes: \([0-9]*\).*/\1/' || echo "0")
-
-            echo "" | tee -a "$REPORT_FILE"
-            echo "Node $i:" | tee -a "$REPORT_FILE"
-            echo "  - PING sent: $PING_SENT" | tee -a "$REPORT_FILE"
-            echo "  - PONG received: $PONG_RECV" | tee -a "$REPORT_FILE"
-            echo "  - FIND_NODE: $FIND_NODE" | tee -a "$REPORT_FILE"
-            echo "  - NEIGHBORS: $NEIGHBORS" | tee -a "$REPORT_FILE"
-            echo "  - Discovered nodes: $DISCOVERED" | tee -a "$REPORT_FILE"
-        fi
-    done
-
-    echo "" | tee -a "$REPORT_FILE"
+    # Write the whole checkpoint through a single tee
+    {
+        echo "========================================"
+        echo "Time: ${t} seconds"
+        echo "========================================"
+
+        # Statistics for selected nodes
+        for i in 0 $(((NODE_COUNT-1)/2)) $((NODE_COUNT-1)); do
+            if [ $i -ge $NODE_COUNT ]; then
+                continue
+            fi
+
+            LOG="logs/${PREFIX}-$i.log"
+
+            if [ ! -f "$LOG" ]; then
+                continue
+            fi
+
+            # Scan the log once and collect every metric from the same pass
+            read -r PING_SENT PONG_RECV FIND_NODE NEIGHBORS DISCOVERED MOCK_DNS DNS_SYNC < <(collect_discovery_metrics "$LOG")
+
+            if [ "$MODE" == "dns" ]; then
+                # DNS-specific metrics
+                echo ""
+                echo "Node $i:"
+                echo "  - Mock DNS enabled: $([ $MOCK_DNS -gt 0 ] && echo 'YES' || echo 'NO')"
+                echo "  - DNS sync checks: $DNS_SYNC"
+                echo "  - Discovered nodes: $DISCOVERED"
+                echo "  - PING sent: $PING_SENT"
+                echo "  - PONG received: $PONG_RECV"
+            else
+                # DHT-specific metrics
+                echo ""
+                echo "Node $i:"
+                echo "  - PING sent: $PING_SENT"
+                echo "  - PONG received: $PONG_RECV"
+                echo "  - FIND_NODE: $FIND_NODE"
+                echo "  - NEIGHBORS: $NEIGHBORS"
+                echo "  - Discovered nodes: $DISCOVERED"
+            fi
+        done
+
+        echo ""
+    } | tee -a "$REPORT_FILE"
 done
 
 # Final statistics
-echo "" | tee -a "$REPORT_FILE"
-echo "========================================" | tee -a "$REPORT_FILE"
-echo "Final Statistics (after ${TEST_DURATION} seconds)" | tee -a "$REPORT_FILE"
-echo "========================================" | tee -a "$REPORT_FILE"
+FINAL_STATS=(
+    ""
+    "========================================"
+    "Final Statistics (after ${TEST_DURATION} seconds)"
+    "========================================"
+)
 
 TOTAL_DISCOVERED=0
 NODES_WITH_DNS=0
@@ -290,28 +286,27 @@ for i in $(seq 0 $((NODE_COUNT-1))); do
         continue
     fi
 
-    DISCOVERED=$(grep "Discovered Nodes:" "$LOG" 2>/dev/null | tail -1 | sed 's/.*Discovered Nodes: \([0-9]*\).*/\1/' || echo "0")
+    read -r _ _ _ _ DISCOVERED MOCK_DNS _ < <(collect_discovery_metrics "$LOG")
     TOTAL_DISCOVERED=$((TOTAL_DISCOVERED + DISCOVERED))
 
     if [ "$MODE" == "dns" ]; then
-        MOCK_DNS=$(grep -c "Mock DNS" "$LOG" 2>/dev/null || echo "0")
         if [ $MOCK_DNS -gt 0 ]; then
             NODES_WITH_DNS=$((NODES_WITH_DNS + 1))
         fi
-        echo "Node $i: DNS=$([ $MOCK_DNS -gt 0 ] && echo 'YES' || echo 'NO'), Discovered=$DISCOVERED" | tee -a "$REPORT_FILE"
+        FINAL_STATS+=("Node $i: DNS=$([ $MOCK_DNS -gt 0 ] && echo 'YES' || echo 'NO'), Discovered=$DISCOVERED")
     else
-        echo "Node $i: Discovered=$DISCOVERED" | tee -a "$REPORT_FILE"
+        FINAL_STATS+=("Node $i: Discovered=$DISCOVERED")
     fi
 done
 
 AVG_DISCOVERED=$((TOTAL_DISCOVERED / NODE_COUNT))
 
-echo "" | tee -a "$REPORT_FILE"
-echo "Averages:" | tee -a "$REPORT_FILE"
+FINAL_STATS+=("")
+FINAL_STATS+=("Averages:")
 if [ "$MODE" == "dns" ]; then
-    echo "  - Nodes with Mock DNS: $NODES_WITH_DNS / $NODE_COUNT" | tee -a "$REPORT_FILE"
+    FINAL_STATS+=("  - Nodes with Mock DNS: $NODES_WITH_DNS / $NODE_COUNT")
 fi
-echo "  - Average discovered: $AVG_DISCOVERED" | tee -a "$REPORT_FILE"
+FINAL_STATS+=("  - Average discovered: $AVG_DISCOVERED")
 
 # Calculate effectiveness
 if [ "$MODE" == "dns" ]; then
@@ -321,7 +316,7 @@ if [ "$MODE" == "dns" ]; then
     else
         DNS_EFFECTIVENESS=0
     fi
-    echo "  - DNS effectiveness: ${DNS_EFFECTIVENESS}%" | tee -a "$REPORT_FILE"
+    FINAL_STATS+=("  - DNS effectiveness: ${DNS_EFFECTIVENESS}%")
 else
     # For DHT: N-1 nodes expected
     EXPECTED=$((NODE_COUNT - 1))
@@ -330,52 +325,57 @@ else
     else
         COVERAGE=0
     fi
-    echo "  - Discovery coverage: ${COVERAGE}%" | tee -a "$REPORT_FILE"
+    FINAL_STATS+=("  - Discovery coverage: ${COVERAGE}%")
 fi
 
+# Write the final statistics through a single tee
+printf '%s\n' "${FINAL_STATS[@]}" | tee -a "$REPORT_FILE"
+
 # Evaluate results
-echo "" | tee -a "$REPORT_FILE"
-echo "========================================" | tee -a "$REPORT_FILE"
-echo "Test Evaluation" | tee -a "$REPORT_FILE"
-echo "========================================" | tee -a "$REPORT_FILE"
+{
+    echo ""
+    echo "========================================"
+    echo "Test Evaluation"
+    echo "========================================"
 
-if [ "$MODE" == "dns" ]; then
-    if [ $NODES_WITH_DNS -eq $NODE_COUNT ]; then
-        echo -e "${GREEN}✅ All nodes enabled Mock DNS${NC}" | tee -a "$REPORT_FILE"
-    else
-        echo -e "${RED}❌ Only $NODES_WITH_DNS/$NODE_COUNT nodes enabled Mock DNS${NC}" | tee -a "$REPORT_FILE"
-    fi
+    if [ "$MODE" == "dns" ]; then
+        if [ $NODES_WITH_DNS -eq $NODE_COUNT ]; then
+            echo -e "${GREEN}✅ All nodes enabled Mock DNS${NC}"
+        else
+            echo -e "${RED}❌ Only $NODES_WITH_DNS/$NODE_COUNT nodes enabled Mock DNS${NC}"
+        fi
 
-    if [ $DNS_EFFECTIVENESS -ge 80 ]; then
-        echo -e "${GREEN}✅ Excellent: DNS discovery ${DNS_EFFECTIVENESS}% effective${NC}" | tee -a "$REPORT_FILE"
-    elif [ $DNS_EFFECTIVENESS -ge 50 ]; then
-        echo -e "${YELLOW}⚠️  Good: DNS discovery ${DNS_EFFECTIVENESS}% effective${NC}" | tee -a "$REPORT_FILE"
-    else
-        echo -e "${RED}❌ Poor: DNS discovery only ${DNS_EFFECTIVENESS}% effective${NC}" | tee -a "$REPORT_FILE"
-    fi
+        if [ $DNS_EFFECTIVENESS -ge 80 ]; then
+            echo -e "${GREEN}✅ Excellent: DNS discovery ${DNS_EFFECTIVENESS}% effective${NC}"
+        elif [ $DNS_EFFECTIVENESS -ge 50 ]; then
+            echo -e "${YELLOW}⚠️  Good: DNS discovery ${DNS_EFFECTIVENESS}% effective${NC}"
+        else
+            echo -e "${RED}❌ Poor: DNS discovery only ${DNS_EFFECTIVENESS}% effective${NC}"
+        fi
 
-    if [ $AVG_DISCOVERED -ge 3 ]; then
-        echo -e "${GREEN}✅ Discovery working: Average ${AVG_DISCOVERED} nodes${NC}" | tee -a "$REPORT_FILE"
-    else
-        echo -e "${YELLOW}⚠️  Low discovery: Only ${AVG_DISCOVERED} nodes average${NC}" | tee -a "$REPORT_FILE"
-    fi
-else
-    if [ $COVERAGE -ge 90 ]; then
-        echo -e "${GREEN}✅ Excellent: Discovery coverage ${COVERAGE}% >= 90%${NC}" | tee -a "$REPORT_FILE"
-    elif [ $COVERAGE -ge 70 ]; then
-        echo -e "${YELLOW}⚠️  Good: Discovery coverage ${COVERAGE}% >= 70%${NC}" | tee -a "$REPORT_FILE"
-    elif [ $COVERAGE -ge 50 ]; then
-        echo -e "${YELLOW}⚠️  Fair: Discovery coverage ${COVERAGE}% >= 50%${NC}" | tee -a "$REPORT_FILE"
+        if [ $AVG_DISCOVERED -ge 3 ]; then
+            echo -e "${GREEN}✅ Discovery working: Average ${AVG_DISCOVERED} nodes${NC}"
+        else
+            echo -e "${YELLOW}⚠️  Low discovery: Only ${AVG_DISCOVERED} nodes average${NC}"
+        fi
     else
-        echo -e "${RED}❌ Poor: Discovery coverage ${COVERAGE}% < 50%${NC}" | tee -a "$REPORT_FILE"
-    fi
+        if [ $COVERAGE -ge 90 ]; then
+            echo -e "${GREEN}✅ Excellent: Discovery coverage ${COVERAGE}% >= 90%${NC}"
+        elif [ $COVERAGE -ge 70 ]; then
+            echo -e "${YELLOW}⚠️  Good: Discovery coverage ${COVERAGE}% >= 70%${NC}"
+        elif [ $COVERAGE -ge 50 ]; then
+            echo -e "${YELLOW}⚠️  Fair: Discovery coverage ${COVERAGE}% >= 50%${NC}"
+        else
+            echo -e "${RED}❌ Poor: Discovery coverage ${COVERAGE}% < 50%${NC}"
+        fi
 
-    if [ $AVG_DISCOVERED -ge 3 ]; then
-        echo -e "${GREEN}✅ Discovery working: Average ${AVG_DISCOVERED} nodes${NC}" | tee -a "$REPORT_FILE"
-    else
-        echo -e "${RED}❌ Insufficient discovery: Only ${AVG_DISCOVERED} average${NC}" | tee -a "$REPORT_FILE"
+        if [ $AVG_DISCOVERED -ge 3 ]; then
+            echo -e "${GREEN}✅ Discovery working: Average ${AVG_DISCOVERED} nodes${NC}"
+        else
+            echo -e "${RED}❌ Insufficient discovery: Only ${AVG_DISCOVERED} average${NC}"
+        fi
     fi
-fi
+} | tee -a "$REPORT_FILE"
 
 echo "" | tee -a "$REPORT_FILE"
 echo "End time: $(date)" >> "$REPORT_FILE"
@@ -79,7 +79,7 @@ if [ "$MODE" == "dns" ]; then
         LOGFILE="logs/${PREFIX}-$NODE_NUM.log"
 
         if [ -f "$LOGFILE" ]; then
-            if grep -q "MOCK DNS MODE ENABLED" "$LOGFILE"; then
+            if grep -qF "MOCK DNS MODE ENABLED" "$LOGFILE"; then
                 MOCK_DNS_COUNT=$((MOCK_DNS_COUNT + 1))
             fi
         fi
@@ -102,7 +102,7 @@ if [ "$MODE" == "dns" ]; then
         LOGFILE="logs/${PREFIX}-$NODE_NUM.log"
 
         if [ -f "$LOGFILE" ]; then
-            if grep -q "DNS Tree URL" "$LOGFILE"; then
+            if grep -qF "DNS Tree URL" "$LOGFILE"; then
                 DNS_URL_COUNT=$((DNS_URL_COUNT + 1))
             fi
         fi
@@ -125,7 +125,7 @@ if [ "$MODE" == "dns" ]; then
         LOGFILE="logs/${PREFIX}-$NODE_NUM.log"
 
         if [ -f "$LOGFILE" ]; then
-            if grep -q "DNS Discovery Status" "$LOGFILE"; then
+            if grep -qF "DNS Discovery Status" "$LOGFILE"; then
                 MONITORING_COUNT=$((MONITORING_COUNT + 1))
             fi
         fi
@@ -152,7 +152,7 @@ else
         LOGFILE="logs/${PREFIX}-$NODE_NUM.log"
 
         if [ -f "$LOGFILE" ]; then
-            if grep -q "Send PING\|Receive PONG" "$LOGFILE"; then
+            if grep -qF -e "Send PING" -e "Receive PONG" "$LOGFILE"; then
                 UDP_COUNT=$((UDP_COUNT + 1))
             fi
         fi
@@ -176,7 +176,7 @@ else
         LOGFILE="logs/${PREFIX}-$NODE_NUM.log"
 
         if [ -f "$LOGFILE" ]; then
-            if grep -q "Send FIND_NODE\|Receive NEIGHBORS" "$LOGFILE"; then
+            if grep -qF -e "Send FIND_NODE" -e "Receive NEIGHBORS" "$LOGFILE"; then
                 DHT_COUNT=$((DHT_COUNT + 1))
             fi
         fi
@@ -200,7 +200,7 @@ else
         LOGFILE="logs/${PREFIX}-$NODE_NUM.log"
 
         if [ -f "$LOGFILE" ]; then
-            if grep -q "Discovery Status" "$LOGFILE"; then
+            if grep -qF "Discovery Status" "$LOGFILE"; then
                 MONITORING_COUNT=$((MONITORING_COUNT + 1))
             fi
         fi
@@ -227,7 +227,7 @@ for pidfile in pids/${PREFIX}-*.pid; do
     LOGFILE="logs/${PREFIX}-$NODE_NUM.log"
 
     if [ -f "$LOGFILE" ]; then
-        DISCOVERED=$(grep "Discovered Nodes:" "$LOGFILE" 2>/dev/null | tail -1 | sed 's/.*Discovered Nodes: \([0-9]*\).*/\1/' || echo "0")
+        DISCOVERED=$(get_discovered_count "$LOGFILE")
         if [ "$DISCOVERED" -gt 0 ] 2>/dev/null; then
             DISCOVERY_COUNT=$((DISCOVERY_COUNT + 1))
             TOTAL_DISCOVERED=$((TOTAL_DISCOVERED + DISCOVERED))
@@ -256,10 +256,7 @@ for pidfile in pids/${PREFIX}-*.pid; do
 
     if [ -f "$LOGFILE" ]; then
         # Look for ERROR but exclude known non-critical patterns
-        ERRORS=$(grep -E "ERROR" "$LOGFILE" 2>/dev/null | \
-                 grep -v "MockDnsResolver" | \
-                 grep -v "Failed to enable mock DNS" | \
-                 wc -l || echo "0")
+        ERRORS=$(count_log_errors "$LOGFILE")
         ERROR_COUNT=$((ERROR_COUNT + ERRORS))
     fi
 done
@@ -237,17 +237,82 @@ check_log_for_errors() {
         "OutOfMemoryError"
         "Failed to start"
     )
-    
+    local patterns=()
+    local found
+
     for error in "${critical_errors[@]}"; do
-        if grep -q "$error" "$log_file" 2>/dev/null; then
-            echo "$error"
-            return 1
-        fi
+        patterns+=(-e "$error")
     done
-    
+
+    # Single scan for all patterns, stopping at the first matching line
+    found=$(grep -m1 -oF "${patterns[@]}" "$log_file" 2>/dev/null || true)
+    if [ -n "$found" ]; then
+        echo "${found%%$'\n'*}"
+        return 1
+    fi
+
     return 0
 }
 
+# Collect discovery metrics from a node log in a single pass
+# Usage: read -r PING PONG FIND_NODE NEIGHBORS DISCOVERED MOCK_DNS DNS_SYNC < <(collect_discovery_metrics LOG_FILE)
+# Prints: ping_sent pong_received find_node neighbors discovered mock_dns dns_sync
+collect_discovery_metrics() {
+    local log_file=$1
+
+    if [ ! -r "$log_file" ]; then
+        echo "0 0 0 0 0 0 0"
+        return 0
+    fi
+
+    awk '
+        index($0, "Sending PING to node:")          { ping++ }
+        index($0, "Received PONG from node:")       { pong++ }
+        index($0, "Sending FIND_NODE to node:")     { find_node++ }
+        index($0, "Received NEIGHBORS from node:")  { neighbors++ }
+        index($0, "Mock DNS")                       { mock_dns++ }
+        index($0, "DNS Discovery Status")           { dns_sync++ }
+        (i = index($0, "Discovered Nodes: "))       { discovered = substr($0, i + 18) + 0 }
+        END {
+            printf "%d %d %d %d %d %d %d\n", ping, pong, find_node, neighbors, discovered, mock_dns, dns_sync
+        }
+    ' "$log_file"
+}
+
+# Get the most recent "Discovered Nodes" count from a node log
+# Usage: get_discovered_count LOG_FILE
+# Prints: Discovered node count (0 if never reported)
+get_discovered_count() {
+    local log_file=$1
+
+    if [ ! -r "$log_file" ]; then
+        echo "0"
+        return 0
+    fi
+
+    awk '
+        (i = index($0, "Discovered Nodes: ")) { discovered = substr($0, i + 18) + 0 }
+        END { printf "%d\n", discovered }
+    ' "$log_file"
+}
+
+# Count ERROR lines in a node log, excluding known non-critical mock DNS errors
+# Usage: count_log_errors LOG_FILE
+# Prints: Number of critical ERROR lines (0 if log is unreadable)
+count_log_errors() {
+    local log_file=$1
+
+    if [ ! -r "$log_file" ]; then
+        echo "0"
+        return 0
+    fi
+
+    awk '
+        index($0, "ERROR") && !index($0, "MockDnsResolver") && !index($0, "Failed to enable mock DNS") { errors++ }
+        END { printf "%d\n", errors }
+    ' "$log_file"
+}
+
 # ============================================================================
 # Cleanup Functions
 # ============================================================================
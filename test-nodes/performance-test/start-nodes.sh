@@ -114,8 +114,8 @@ log_section "Initial Connection Check"
 for i in $(seq 0 $((NODE_COUNT-1))); do
     LOG_FILE="logs/${TEST_TYPE}-node-${i}.log"
     if [ -f "$LOG_FILE" ]; then
-        CONN_COUNT=$(grep -c "handshake success" "$LOG_FILE" 2>/dev/null || echo "0")
-        log_info "Node $i: $CONN_COUNT connections"
+        CONN_COUNT=$(grep -cF "handshake success" "$LOG_FILE" 2>/dev/null || true)
+        log_info "Node $i: ${CONN_COUNT:-0} connections"
     fi
 done
 